@@ -1,13 +1,26 @@
 "This implementation is purely theorical and experimental, and should not be used in development for now."
-from tharospytools.bio_tools import revcomp
 from tharospytools.overloading import overload
 from pgGraphs import Graph as FullGraph
-from re import split as resplit
 # Bubble object with fields:
 # - nodes inside
 # - paths inside
 # - sequences described by paths (can be seen as sort of local gapless alingments)
 
+# Translation tables for reverse complement, including IUPAC ambiguity codes
+_RCTAB: dict = str.maketrans(
+    'ACGTNacgtnRYMKSWHBVDrymkswhbvd',
+    'TGCANtgcanYRKMSWDVBHyrkmswdvbh'
+)
+_RCTAB_BYTES: bytes = bytes.maketrans(
+    b'ACGTNacgtnRYMKSWHBVDrymkswhbvd',
+    b'TGCANtgcanYRKMSWDVBHyrkmswdvbh'
+)
+
+
+def _revcomp(sequence: str | bytes) -> str | bytes:
+    "Computes the reverse complement of a sequence (str or ASCII bytes) with a single C-level translation pass"
+    return sequence.translate(_RCTAB if isinstance(sequence, str) else _RCTAB_BYTES)[::-1]
+
 
 class Bubble():
 
@@ -29,29 +42,40 @@ class Bubble():
 
     def __init__(self, bubble_name: str, segments: dict, local_paths: dict) -> None:
         """
-        nodes is a list of all nodes inside the bubble
+        nodes is the set of all nodes inside the bubble
         content is a dict mapping paths to sequences
-        segments are supposed to be a sub part of a gfagraphs.pgGraphs.Graph segment dict
+        segments are supposed to be a sub part of a gfagraphs.pgGraphs.Graph segment dict,
+        with sequences given either as str or as ASCII bytes (paths will then be bytes too)
         local_paths is a mapping path_name:path_composantes (as list of tuples)
         """
         self.name: str = bubble_name
-        self.nodes: set[str] = list(segments.keys())
-        self.base_weight: int = sum([len(seq) for seq in segments.values()])
-        self.paths: dict[str, str] = {
-            path_name: ''.join([(segments[seg_name], revcomp(segments[seg_name]))[seg_ori == '-'] for (seg_name, seg_ori) in path_sequence]) for path_name, path_sequence in local_paths.items()
+        self.nodes: frozenset[str] = frozenset(segments)
+        # Lengths are computed once, for the weight and the decomposition
+        lengths: dict[str, int] = {
+            seg_name: len(seq) for seg_name, seq in segments.items()}
+        self.base_weight: int = sum(lengths.values())
+        # Reverse complements are computed once per segment, on first reverse traversal
+        reversed_segments: dict[str, str | bytes] = dict()
+        # Empty value of the same type as sequences, used to join them
+        separator: str | bytes = type(next(iter(segments.values()), ''))()
+        self.paths: dict[str, str | bytes] = {
+            path_name: separator.join(segments[seg_name] if seg_ori != '-' else (reversed_segments.get(seg_name) or reversed_segments.setdefault(seg_name, _revcomp(segments[seg_name]))) for (seg_name, seg_ori) in path_sequence) for path_name, path_sequence in local_paths.items()
         }
         # TODO: think of a higher compression level for this not_human readable string
-        self.__decompose__: str = ';'.join([path_name+'#'+':'.join([node_name+node_ori+str(len(segments[node_name])) for (
-            node_name, node_ori) in path_sequence]) for path_name, path_sequence in local_paths.items()])
+        decomposition: list[str] = list()
+        for path_name, path_sequence in local_paths.items():
+            decomposition.append(
+                f"{path_name}#{':'.join(f'{node_name}{node_ori}{lengths[node_name]}' for (node_name, node_ori) in path_sequence)}")
+        self.__decompose__: str = ';'.join(decomposition)
 
-    def __alt__(self, bubble_name: str, nodes: set[str], paths: dict[str, str], decomposition: str) -> None:
+    def __alt__(self, bubble_name: str, nodes: set[str] | frozenset[str], paths: dict[str, str], decomposition: str) -> None:
         """
         Objective of this function is to be able to reload a previously saved bubble
         by loading in memory all its fields and hopefully using unfold it reveals its internals
         (not recursive in this first implementation)
         """
         self.name: str = bubble_name
-        self.nodes: set[str] = nodes
+        self.nodes: frozenset[str] = frozenset(nodes)
         self.paths: dict[str, str] = paths
         self.__decompose__: str = decomposition
 
@@ -68,12 +92,14 @@ class Bubble():
             path_name, _, path_value = path.partition('#')
             local_paths[path_name] = list()
             for node_info in path_value.split(':'):
-                node_name, node_ori, node_length = resplit(
-                    '([+|-])', node_info)
+                # Orientation sign is the last + or -, as the length after it is only digits
+                ori_pos: int = max(node_info.rfind('+'), node_info.rfind('-'))
+                node_name, node_ori, node_length = node_info[:ori_pos], node_info[ori_pos], int(
+                    node_info[ori_pos+1:])
                 segments[node_name] = self.paths[path_name][pos_counter:(
-                    pos_counter := pos_counter+int(node_length))]
+                    pos_counter := pos_counter+node_length)]
                 if node_ori == '-':
-                    segments[node_name] = revcomp(segments[node_name])
+                    segments[node_name] = _revcomp(segments[node_name])
                 local_paths[path_name].append((node_name, node_ori))
         return (self.name, segments, local_paths)
 
@@ -2,17 +2,58 @@
 from os import stat
 from os.path import exists
 from enum import Enum
-from re import sub, match
-from typing import Callable
+from re import compile as compile_regex
+from string import ascii_uppercase, ascii_letters
+from typing import Callable, TextIO
+from contextlib import nullcontext
 from copy import deepcopy
 from json import loads, dumps
 from itertools import chain
 from networkx import MultiDiGraph, DiGraph
 from tharospytools.matplotlib_tools import get_palette
 from warnings import warn
+from sys import intern
 
 warn("The lib gfagraphs is now deprecated. Please move your program to use pgGraphs (also included in the lib) as delepoppement efforts goes into it.")
 
+# Allowed characters for the name and the type of an optional tag (XX:T:value)
+_TAG_NAME_CHARS: frozenset = frozenset(ascii_uppercase)
+_TAG_TYPE_CHARS: frozenset = frozenset(ascii_letters)
+# Cast to apply to the value of an optional tag, by GFA type letter
+_GFA_TYPES: dict[str, type | Callable] = {
+    'i': int, 'f': float, 'A': str, 'Z': str, 'J': loads}
+# Sequences up to this length are interned: there are few distinct ones, and they are very frequent
+_SHARED_SEQUENCE_LENGTH: int = 8
+# GFA type letters of the most common tag value types
+_DTYPE_FAST: dict[type, str] = {int: 'i', bool: 'i', float: 'f', str: 'Z'}
+# Captures (orientation, node) pairs from the path field of a W-line, such as >1<2>3
+_WALK_STEP = compile_regex(r'([<>])([^<>]+)')
+# Translation table deleting all non-digit ASCII characters, and pattern for other names
+_NON_DIGITS: dict = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+_NON_DIGITS_PATTERN = compile_regex(r'\D')
+# Fields of segments and lines written as positional columns, and not as optional tags
+_SEGMENT_FIELDS: frozenset = frozenset(('length', 'seq', 'name'))
+_LINE_FIELDS: frozenset = frozenset(('orientation', 'start', 'end'))
+
+
+def strip_non_digits(name: str) -> str:
+    """Removes all non-digit characters from a node name.
+    Names made only of digits are returned as is, ASCII names are cleaned with a translation table,
+    and the regex is only used as a fallback for other names.
+
+    Args:
+        name (str): a node name
+
+    Returns:
+        str: the digits of the name
+    """
+    if name.isdecimal():
+        return name
+    if name.isascii():
+        return name.translate(_NON_DIGITS)
+    return _NON_DIGITS_PATTERN.sub('', name)
+
 
 def get_gfa_subtype(gfa_file_path: str | list[str]) -> str | list[str]:
     """Given a file, or more, returns the gfa subtypes, and raises error if file is invalid or does not exists
@@ -81,15 +122,9 @@ def gtype(tag_type: str) -> type | Callable:
     Returns:
         type | Callable: the cast method or type to apply
     """
-    if tag_type == 'i':
-        return int
-    elif tag_type == 'f':
-        return float
-    elif tag_type == 'A' or tag_type == 'Z':
-        return str
-    elif tag_type == 'J':
-        return loads
-    elif tag_type == 'H' or tag_type == 'B':
+    if (cast := _GFA_TYPES.get(tag_type)) is not None:
+        return cast
+    if tag_type == 'H' or tag_type == 'B':
         raise NotImplementedError()
     raise ValueError(f"Type identifier {tag_type} is not in the GFA standard")
 
@@ -107,6 +142,9 @@ def dtype(data: object) -> str:
     Returns:
         type | Callable: the cast method or type to apply
     """
+    # Exact builtin types are resolved in one lookup, subclasses and JSON go through the checks
+    if (tag_type := _DTYPE_FAST.get(type(data))) is not None:
+        return tag_type
     if isinstance(data, int):
         return 'i'
     elif isinstance(data, float):
@@ -122,23 +160,44 @@ def dtype(data: object) -> str:
                 f"Type {type(data)} is not in the GFA standard") from exc
 
 
-def supplementary_datas(datas: list, length_condition: int) -> dict:
+def _format_tags(datas: dict, skip: frozenset = frozenset()) -> str:
+    """Formats the optional tags of a record as GFA fields, joined by tabulations.
+    Unnamed fields (ARG) are written back as is, other tags as XX:T:value.
+
+    Args:
+        datas (dict): the datas of a record
+        skip (frozenset, optional): positional fields of the record, which are not tags. Defaults to frozenset().
+
+    Returns:
+        str: the tags of the record, ready to be written
+    """
+    # Type letters of common tag values are looked up directly, other values go through dtype()
+    type_letter: Callable = _DTYPE_FAST.get
+    return '\t'.join([str(value) if key.startswith('ARG') else f"{key}:{type_letter(type(value)) or dtype(value)}:{value}" for key, value in datas.items() if key not in skip])
+
+
+def supplementary_datas(datas: list, length_condition: int, mapping: dict | None = None) -> dict:
     """Computes the optional tags of a gfa line and returns them as a dict
 
     Args:
         datas (list): parsed data line
         length_condition (int): last position of positional field
+        mapping (dict | None, optional): dict to add the tags to, so a record only needs one dict. Defaults to None.
 
     Returns:
         dict: mapping tag:value
     """
-    mapping: dict = dict()
+    if mapping is None:
+        mapping: dict = dict()
     nargs: int = length_condition
     if len(datas) > length_condition:  # we happen to have additional tags to our line
         for additional_tag in datas[length_condition:]:
-            if match('[A-Z]{2}:[a-zA-Z]{1}:', additional_tag):  # matches start of the line
-                mapping[additional_tag[:2]] = gtype(
-                    additional_tag[3])(additional_tag[5:])
+            # matches start of the line against XX:T:
+            if len(additional_tag) >= 5 and additional_tag[2] == ':' and additional_tag[4] == ':' and additional_tag[0] in _TAG_NAME_CHARS and additional_tag[1] in _TAG_NAME_CHARS and additional_tag[3] in _TAG_TYPE_CHARS:
+                tag_name, tag_type, tag_value = additional_tag.split(':', 2)
+                # Tag names are interned, as the same few keys are shared across all lines
+                mapping[intern(tag_name)] = (_GFA_TYPES.get(
+                    tag_type) or gtype(tag_type))(tag_value)
             else:
                 mapping[f"ARG{nargs}"] = additional_tag
                 nargs += 1
@@ -152,6 +211,18 @@ class Orientation(Enum):
     UNKNOWN = '?'
 
 
+# Direct lookups from GFA orientation characters to Orientation members
+_ORIENTATIONS: dict[str, Orientation] = {
+    orientation.value: orientation for orientation in Orientation}
+_WALK_ORIENTATIONS: dict[str, Orientation] = {
+    '>': Orientation.FORWARD, '<': Orientation.REVERSE}
+# Segment fields always displayed first in node titles of networkx graphs
+_FIXED_TITLE_KEYS: frozenset = frozenset(('name', 'length'))
+# Edge labels for each pair of orientations, as displayed in networkx graphs
+_ORIENTATION_PAIR_LABELS: dict[tuple[Orientation, Orientation], str] = {
+    (left, right): f"{left.value}/{right.value}" for left in Orientation for right in Orientation}
+
+
 class GfaStyle(Enum):
     "Describes the different possible formats"
     RGFA = 'rGFA'
@@ -167,21 +238,12 @@ class LineType():
     __slots__ = ['type', 'func']
 
     def __init__(self, key: str) -> None:
-        default_value: tuple = (default, Other)
-        mapping: dict = {
-            'H': (header, Header),
-            'S': (segment, Segment),
-            'L': (line, Line),
-            'C': (containment, Containment),
-            'P': (path, Path),
-            'W': (walk, Walk),
-            'J': (jump, Jump)
-        }
-        self.func, self.type = mapping.get(key, default_value)
+        self.func, self.type = _LINE_TYPES.get(key, _DEFAULT_LINE_TYPE)
 
 
 class Header():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -195,6 +257,7 @@ class Header():
 
 class Segment():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -202,8 +265,14 @@ class Segment():
     def __init__(self, name: str, seq: str, **kwargs) -> None:
         self.datas: dict = {'name': name, 'seq': seq, **kwargs}
 
+    @property
+    def seq(self) -> str:
+        "Sequence of the segment, or a run of N of the right length if it was loaded without sequence"
+        sequence: str | None = self.datas.get('seq')
+        return sequence if sequence is not None else 'N'*self.datas['length']
+
     def __str__(self) -> str:
-        return f"{self.datas['name']}\t{self.datas['seq'] if 'seq' in self.datas else 'N'*self.datas['length']}\t" + '\t'.join([f"{key}:{dtype(value)}:{value}" for key, value in self.datas.items() if key not in ['length', 'seq', 'name']])
+        return f"{self.datas['name']}\t{self.seq}\t" + '\t'.join([f"{key}:{dtype(value)}:{value}" for key, value in self.datas.items() if key not in _SEGMENT_FIELDS])
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -211,6 +280,7 @@ class Segment():
 
 class Line():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -221,7 +291,7 @@ class Line():
 
     def __str__(self) -> str:
         ori1, ori2 = self.datas['orientation'].split('/')
-        return f"{self.datas['start']}\t{ori1}\t{self.datas['end']}\t{ori2}\t" + '\t'.join([f"{key}:{dtype(value)}:{value}" for key, value in self.datas.items() if key not in ['orientation', 'start', 'end']])
+        return f"{self.datas['start']}\t{ori1}\t{self.datas['end']}\t{ori2}\t" + '\t'.join([f"{key}:{dtype(value)}:{value}" for key, value in self.datas.items() if key not in _LINE_FIELDS])
 
     def __repr__(self) -> str:
         return self.__str__()
@@ -229,6 +299,7 @@ class Line():
 
 class Containment():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -236,6 +307,7 @@ class Containment():
 
 class Path():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -246,6 +318,7 @@ class Path():
 
 class Walk():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -253,6 +326,7 @@ class Walk():
 
 class Jump():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -260,6 +334,7 @@ class Jump():
 
 class Other():
     "Empty type to define linestyle"
+    __slots__ = ['gfastyle', 'linetype', 'datas']
     datas: dict
     gfastyle: GfaStyle
     linetype: LineType
@@ -305,11 +380,45 @@ def segment(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
         dict: mapping tags:values
     """
     line_datas: dict = dict()
-    line_datas["name"] = sub('\D', '', datas[1])
-    line_datas["length"] = len(datas[2])
+    line_datas["name"] = intern(strip_non_digits(datas[1]))
+    length: int = len(datas[2])
+    line_datas["length"] = length
     if kwargs['ws']:
-        line_datas["seq"] = datas[2]
-    return {**line_datas, **supplementary_datas(datas, 3)}
+        # Short sequences, such as SNP alleles, repeat across the graph and are shared
+        line_datas["seq"] = intern(
+            datas[2]) if length <= _SHARED_SEQUENCE_LENGTH else datas[2]
+    return supplementary_datas(datas, 3, line_datas)
+
+
+def segment_without_sequence(gfa_data_line: str) -> dict:
+    """Extracts the data from a segment line, without ever building the sequence string.
+    The length of the sequence is computed from the positions of the tabulations around it.
+
+    Args:
+        gfa_data_line (str): raw GFA segment line
+
+    Raises:
+        IndexError: if the line does not have a sequence field
+
+    Returns:
+        dict: mapping tags:values
+    """
+    end: int = len(gfa_data_line) - gfa_data_line.endswith('\n')
+    name_start: int = gfa_data_line.find('\t', 0, end) + 1
+    seq_start: int = gfa_data_line.find('\t', name_start, end) + 1
+    if not name_start or not seq_start:
+        raise IndexError("Segment line does not have a sequence field.")
+    seq_end: int = gfa_data_line.find('\t', seq_start, end)
+    if seq_end == -1:
+        seq_end = end
+    line_datas: dict = dict()
+    line_datas["name"] = intern(strip_non_digits(
+        gfa_data_line[name_start:seq_start-1]))
+    line_datas["length"] = seq_end - seq_start
+    if seq_end == end:
+        return line_datas
+    # Positional fields are already processed, only optional tags are split
+    return supplementary_datas([None, None, None] + gfa_data_line[seq_end+1:end].split('\t'), 3, line_datas)
 
 
 def line(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
@@ -323,10 +432,10 @@ def line(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
         dict: mapping tags:values
     """
     line_datas: dict = dict()
-    line_datas["start"] = sub('\D', '', datas[1])
-    line_datas["end"] = sub('\D', '', datas[3])
+    line_datas["start"] = intern(strip_non_digits(datas[1]))
+    line_datas["end"] = intern(strip_non_digits(datas[3]))
     line_datas["orientation"] = f"{datas[2]}/{datas[4]}"
-    return {**line_datas, **supplementary_datas(datas, 5)}
+    return supplementary_datas(datas, 5, line_datas)
 
 
 def containment(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
@@ -360,14 +469,15 @@ def path(datas: list[str], gfa_style: GfaStyle, **kwargs) -> dict:
         raise ValueError(
             f"Incompatible version format, P-lines vere added in GFA1 and were absent from {gfa_style}.")
     line_datas["name"] = datas[1]
+    # Step names are interned, so they share the string objects of segment names
     line_datas["path"] = [
         (
-            node[:-1],
-            Orientation(node[-1])
+            intern(node[:-1]),
+            _ORIENTATIONS[node[-1]]
         )
         for node in datas[2].split(',')
     ]
-    return {**line_datas, **supplementary_datas(datas, 7)}
+    return supplementary_datas(datas, 7, line_datas)
 
 
 def walk(datas: list[str], gfa_style: GfaStyle, **kwargs) -> dict:
@@ -381,7 +491,7 @@ def walk(datas: list[str], gfa_style: GfaStyle, **kwargs) -> dict:
         dict: mapping tags:values
     """
     line_datas: dict = dict()
-    if gfa_style in [GfaStyle.RGFA, GfaStyle.GFA1]:
+    if gfa_style is GfaStyle.RGFA or gfa_style is GfaStyle.GFA1:
         raise ValueError(
             f"Incompatible version format, W-lines vere added in GFA1.1 and were absent from {gfa_style}.")
     line_datas["id"] = datas[3]
@@ -389,14 +499,15 @@ def walk(datas: list[str], gfa_style: GfaStyle, **kwargs) -> dict:
     line_datas["name"] = datas[1]
     line_datas["start_offset"] = datas[4]
     line_datas["stop_offset"] = datas[5]
+    # Step names are interned, so they share the string objects of segment names
     line_datas["path"] = [
         (
-            node[1:],
-            Orientation(node[0])
+            intern(node),
+            _WALK_ORIENTATIONS[sign]
         )
-        for node in datas[6].replace('>', ',+').replace('<', ',-')[1:].split(',')
+        for sign, node in _WALK_STEP.findall(datas[6])
     ]
-    return {**line_datas, **supplementary_datas(datas, 7)}
+    return supplementary_datas(datas, 7, line_datas)
 
 
 def jump(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
@@ -409,30 +520,90 @@ def jump(datas: list, gfa_style: GfaStyle, **kwargs) -> dict:
     Returns:
         dict: mapping tags:values
     """
-    if gfa_style in [GfaStyle.RGFA, GfaStyle.GFA1, GfaStyle.GFA1_1]:
+    if gfa_style is GfaStyle.RGFA or gfa_style is GfaStyle.GFA1 or gfa_style is GfaStyle.GFA1_1:
         raise ValueError(
             f"Incompatible version format, J-lines vere added in GFA1.2 and were absent from {gfa_style}.")
     return supplementary_datas(datas, 1)
 
 
+# Parsing function and record type for each GFA line first char
+_LINE_TYPES: dict[str, tuple[Callable, type]] = {
+    'H': (header, Header),
+    'S': (segment, Segment),
+    'L': (line, Line),
+    'C': (containment, Containment),
+    'P': (path, Path),
+    'W': (walk, Walk),
+    'J': (jump, Jump)
+}
+_DEFAULT_LINE_TYPE: tuple[Callable, type] = (default, Other)
+# Line types hold no per-line state, so a single instance per line letter is shared by all records
+_SHARED_LINE_TYPES: dict[str, LineType] = {
+    key: LineType(key) for key in _LINE_TYPES}
+_SHARED_DEFAULT_LINE_TYPE: LineType = LineType('')
+
+
 class Record():
     """
-    Modelizes a GFA line
+    Modelizes a GFA line.
+    Building a Record returns an object of the record type matching the line
+    (Header, Segment, Line...), with its gfastyle, linetype and datas attributes set.
     """
-    __slots__ = ['gfastyle', 'linetype', 'datas', '__class__']
+    __slots__ = []
+
+    def __new__(cls, gfa_data_line: str, gfa_type: str | GfaStyle, kwargs: dict = {}) -> Header | Segment | Line | Containment | Path | Walk | Jump | Other:
+        linetype: LineType = _SHARED_LINE_TYPES.get(
+            gfa_data_line[0], _SHARED_DEFAULT_LINE_TYPE)
+        # Object is created with its final type, bypassing the constructors used for graph edition
+        record = object.__new__(linetype.type)
+        # Graph hands over its already resolved style, which skips an Enum lookup per line
+        record.gfastyle = gfa_type if isinstance(
+            gfa_type, GfaStyle) else GfaStyle(gfa_type)
+        record.linetype = linetype
+        if linetype.type is Segment and kwargs.get('ws') is False:
+            # Sequence is not needed, we skip splitting it out of the line
+            record.datas = segment_without_sequence(gfa_data_line)
+        else:
+            datas: list = gfa_data_line.split('\t')
+            # Only the last field holds the line break: stripping it alone avoids copying the whole line
+            datas[-1] = datas[-1].rstrip('\n')
+            record.datas = linetype.func(
+                datas, record.gfastyle, **kwargs)
+        return record
 
-    def __init__(self, gfa_data_line: str, gfa_type: str, kwargs: dict = {}) -> None:
-        datas: list = gfa_data_line.strip('\n').split('\t')
-        self.gfastyle: GfaStyle = GfaStyle(gfa_type)
-        self.linetype: LineType = LineType(gfa_data_line[0])
-        self.datas: dict = self.linetype.func(datas, self.gfastyle, **kwargs)
-        self.__class__ = self.linetype.type
 
-    def __str__(self) -> str:
-        return "RawRecord()"
+def _clone_segment(segment: Segment) -> Segment:
+    """Copies a segment without going through deepcopy.
+    Its datas dict is copied, and only mutable values (JSON tags) are deep copied,
+    as names, sequences and numbers are immutable and can be shared.
 
-    def __repr__(self) -> str:
-        return self.__str__()
+    Args:
+        segment (Segment): the segment to copy
+
+    Returns:
+        Segment: an independent copy of the segment
+    """
+    clone: Segment = object.__new__(type(segment))
+    clone.datas = {key: deepcopy(value) if isinstance(value, (dict, list)) else value
+                   for key, value in segment.datas.items()}
+    # Segments created by graph edition do not have those attributes set
+    for attribute in ('gfastyle', 'linetype'):
+        if hasattr(segment, attribute):
+            setattr(clone, attribute, getattr(segment, attribute))
+    return clone
+
+
+# Maps each record type to the name of the Graph attribute holding such records
+_RECORD_BUCKETS: dict[type, str] = {
+    Header: 'headers',
+    Segment: 'segments',
+    Line: 'lines',
+    Containment: 'containment',
+    Path: 'paths',
+    Walk: 'walks',
+    Jump: 'jumps',
+    Other: 'others',
+}
 
 
 class Graph():
@@ -440,13 +611,14 @@ class Graph():
     Modelizes a GFA graph
     """
     __slots__ = ['version', 'graph', 'headers', 'segments', 'mapping',
-                 'lines', 'containment', 'paths', 'walks', 'jumps', 'others', 'colors']
+                 'lines', 'containment', 'paths', 'walks', 'jumps', 'others', 'colors',
+                 '_segment_index', '_path_index']
 
-    def __init__(self, gfa_file: str | None = None, gfa_type: str = 'unknown', with_sequence: bool = False) -> None:
+    def __init__(self, gfa_file: str | TextIO | None = None, gfa_type: str = 'unknown', with_sequence: bool = False) -> None:
         """Constructor for GFA Graph object.
 
         Args:
-            gfa_file (str | None, optional): A file path to a valid GFA file. Defaults to None.
+            gfa_file (str | TextIO | None, optional): A file path to a valid GFA file, or an already opened text stream of GFA lines. Defaults to None.
             gfa_type (str, optional): A descriptor for the GFA sub-format : ['rGFA','GFA1','GFA1.1','GFA1.2','GFA2']. Defaults to 'unknown'.
             with_sequence (bool, optional): If sequence should be included in nodes. Consumes more memory with huge graphs. Defaults to False.
 
@@ -468,46 +640,53 @@ class Graph():
         self.others: list[Other] = []
         self.graph = MultiDiGraph()
         if gfa_file:
-            # We try to load file from disk
-            # Checking if path exists
-            if not exists(gfa_file):
-                raise OSError(
-                    "Specified file does not exists. Please check provided path."
-                )
-            # Checking if file descriptor is valid
-            if not gfa_file.endswith('.gfa'):
-                raise IOError(
-                    "File descriptor is invalid. Please check format, this lib is designed to work with Graphical Fragment Assembly (GFA) files."
-                )
-            # Checking if file is not empty
-            if stat(gfa_file).st_size == 0:
-                raise IOError(
-                    "File is empty."
-                )
+            # We try to load file from disk, unless an opened stream is given
+            if isinstance(gfa_file, str):
+                # Checking if path exists
+                if not exists(gfa_file):
+                    raise OSError(
+                        "Specified file does not exists. Please check provided path."
+                    )
+                # Checking if file descriptor is valid
+                if not gfa_file.endswith('.gfa'):
+                    raise IOError(
+                        "File descriptor is invalid. Please check format, this lib is designed to work with Graphical Fragment Assembly (GFA) files."
+                    )
+                # Checking if file is not empty
+                if stat(gfa_file).st_size == 0:
+                    raise IOError(
+                        "File is empty."
+                    )
 
+            # Lists receiving each record type are resolved once for the whole file
+            buckets: dict[type, list] = {
+                record_type: getattr(self, attribute) for record_type, attribute in _RECORD_BUCKETS.items()}
+            # Parsing options are the same for every line, so they are built only once
+            record_kwargs: dict = {'ws': with_sequence}
             # All lines shall start by a captial letter (see GFAspec). If not, we raise ValueError
-            with open(gfa_file, 'r', encoding='utf-8') as gfa_reader:
+            # A large read buffer cuts down the number of reads on multi-gigabyte files
+            # A given stream is left open, as it belongs to the caller
+            with open(gfa_file, 'r', encoding='utf-8', buffering=1 << 20) if isinstance(gfa_file, str) else nullcontext(gfa_file) as gfa_reader:
                 for gfa_line in gfa_reader:
-
-                    if not gfa_line[0].isupper() and len(gfa_line.strip()) != 0:
+                    # Blank lines and comments hold no record, and are skipped before any parsing
+                    if gfa_line[0] == '#' or gfa_line.isspace():
+                        continue
+                    if not gfa_line[0].isupper():
                         raise ValueError(
                             "All GFA lines shall start with a capital letter. Wrong format, please fix."
                         )
                     # We parse the GFA line with the record class
-                    record: Record = Record(
+                    record = Record(
                         gfa_line,
-                        self.version.value,
-                        {
-                            'ws': with_sequence
-                        }
+                        self.version,
+                        record_kwargs
                     )
                     # We put record in the right list
-                    if isinstance(record, Header):
-                        self.headers.append(record)
+                    record_type: type = type(record)
+                    buckets.get(record_type, self.others).append(record)
+                    if record_type is Header:
                         try:
-                            version_number: str = supplementary_datas(
-                                gfa_line.strip('\n').split('\t'), 1
-                            )["VN"]
+                            version_number: str = record.datas["VN"]
                             if version_number == '1.0':
                                 self.version = GfaStyle('GFA1')
                             elif version_number == '1.1':
@@ -520,23 +699,10 @@ class Graph():
                                 self.version = GfaStyle('unknown')
                         except KeyError:
                             self.version = GfaStyle('rGFA')
-                    elif isinstance(record, Segment):
-                        self.segments.append(record)
-                    elif isinstance(record, Line):
-                        self.lines.append(record)
-                    elif isinstance(record, Containment):
-                        self.containment.append(record)
-                    elif isinstance(record, Path):
-                        self.paths.append(record)
-                    elif isinstance(record, Walk):
-                        self.walks.append(record)
-                    elif isinstance(record, Jump):
-                        self.jumps.append(record)
-                    else:
-                        self.others.append(record)
             # Checking GFA style
         self.mapping: dict = {
-            node.datas["name"]: node.datas["seq"] for node in self.segments}
+            node.datas["name"]: node.datas["seq"] for node in self.segments if 'seq' in node.datas}
+        self.index_records()
 
     def __str__(self) -> str:
         return f"GFA Graph object (version {self.version.value}) containing {len(self.segments)} segments, {len(self.lines)} edges and {len(self.paths)+len(self.walks)} paths."
@@ -549,14 +715,28 @@ class Graph():
         """
         return self.mapping[name]
 
+    def index_records(self) -> None:
+        """Builds the name indexes used to access segments and paths in constant time.
+        Segments are indexed by their position in the list of segments, paths by the record itself.
+        Graph edition methods keep them up to date ; if the `segments`, `paths` or `walks`
+        lists are edited directly, this method should be called again.
+        When names are duplicated, the first record in list order is indexed.
+        """
+        self._segment_index: dict[str, int] = {
+            self.segments[position].datas["name"]: position for position in range(len(self.segments)-1, -1, -1)}
+        self._path_index: dict[str, Path | Walk] = {
+            gpath.datas["name"]: gpath for gpath in chain(reversed(self.walks), reversed(self.paths))}
+
     def add_node(self, name: str, sequence: str) -> None:
         self.segments.append(Segment(name, sequence))
+        self._segment_index.setdefault(name, len(self.segments)-1)
 
     def add_edge(self, source, ori_source, sink, ori_sink) -> None:
         self.lines.append(Line(source, ori_source, sink, ori_sink))
 
     def add_path(self, name, chain) -> None:
-        self.paths.append(Path(name, chain))
+        self.paths.append(new_path := Path(name, chain))
+        self._path_index.setdefault(name, new_path)
 
     def split_segments(self, segment_name: str, future_segment_name: str | list, position_to_split: tuple | list) -> None:
         """Given a segment to split and a series/single new name(s) + position(s),
@@ -582,8 +762,7 @@ class Graph():
             raise ValueError("Parameters does not have the same length.")
 
         # Possible multi-split
-        sequence = node_to_split.datas['seq'] if 'seq' in node_to_split.datas else 'N' * \
-            node_to_split.datas['length']
+        sequence: str = node_to_split.seq
 
         # Get incomming and exuting edges
         edges_of_node: list[Line] = self.get_edges(segment_name)
@@ -598,8 +777,7 @@ class Graph():
                 # Edge is incomming edge, should be kept
 
         # Edit first node
-        node_to_split.datas['seq'] = node_to_split.datas['seq'][:position_to_split[0][1]
-                                                                ] if 'seq' in node_to_split.datas else 'N'*position_to_split[0][1]
+        node_to_split.datas['seq'] = sequence[:position_to_split[0][1]]
 
         for i, positions in enumerate(position_to_split):
             # Divide the node by creating an new one and updating attributes
@@ -623,15 +801,14 @@ class Graph():
                 pass
 
         # Add to paths by inserting after node to be splitted
-        for ipath in self.get_path_list():
-            edited: bool = False
-            for posx, sparkl in enumerate(ipath.datas['path']):
-                node, _ = sparkl
-                if node == segment_name and not edited:
-                    edited = True
-                    ipath.datas['path'].remove(sparkl)
-                    ipath.datas['path'][posx:posx] = [(nname, Orientation(
-                        orient)) for nname in future_segment_name]
+        for ipath in chain(self.paths, self.walks):
+            for posx, (node, _) in enumerate(ipath.datas['path']):
+                if node == segment_name:
+                    # Only the first occurrence is replaced, in place, by the new nodes
+                    ipath.datas['path'][posx:posx+1] = [
+                        (nname, _ORIENTATIONS[orient]) for nname in future_segment_name]
+                    break
+        self.index_records()
 
     def rename_node(self, old_name: str, new_name: str, edit_paths: bool = True) -> Segment | None:
         "Performs node name edition operation on graph"
@@ -644,6 +821,8 @@ class Graph():
             return None
         # Changing the name of the node
         to_edit.datas['name'] = new_name
+        self._segment_index.setdefault(
+            new_name, self._segment_index.pop(old_name))
         # Changing the name inside edges
         edges_to_edit: list = self.get_edges(old_name)
         for e in edges_to_edit:
@@ -653,16 +832,12 @@ class Graph():
                 e.datas['end'] = new_name
         # Updataing path names
         if edit_paths:
-            for p in self.walks:
-                for idx, (nname, ori) in enumerate(p.datas['path']):
-                    if nname == old_name:
-                        p.datas['path'] = p.datas['path'][:idx] + \
-                            [(new_name, ori)]+p.datas['path'][idx+1:]
-            for p in self.paths:
-                for idx, (nname, ori) in enumerate(p.datas['path']):
+            for p in chain(self.walks, self.paths):
+                steps: list = p.datas['path']
+                for idx, (nname, ori) in enumerate(steps):
                     if nname == old_name:
-                        p.datas['path'] = p.datas['path'][:idx] + \
-                            [(new_name, ori)]+p.datas['path'][idx+1:]
+                        # Step is replaced in place, without copying the whole path
+                        steps[idx] = (new_name, ori)
 
     def merge_segments(self, *segs: str, merge_name: str | None = None, reversed: bool = False) -> str:
         """Given a series of nodes, merges it to the first of the series.
@@ -695,31 +870,32 @@ class Graph():
             else:
                 self.lines[edge_pos].datas['end'] = left_most_name
 
-        edges_to_delete = list(chain(*[self.get_edges_positions(
-            self.segments[node_pos].datas['name']) for node_pos in segments_positions[1:-1]]))
+        edges_to_delete = list(chain.from_iterable(self.get_edges_positions(
+            self.segments[node_pos].datas['name']) for node_pos in segments_positions[1:-1]))
 
         # Edit the paths by iterating over all paths
         # We assert position matching, and we reverse the ordering to edit without destrying info
-        for ipath in self.get_path_list():
-            sequence_length: int = len(names_to_be_deleted)
+        sequence_length: int = len(names_to_be_deleted)
+        first_name: str | None = names_to_be_deleted[0] if names_to_be_deleted else None
+        for ipath in chain(self.paths, self.walks):
             path_segments: list = [waypoint[0]
                                    for waypoint in ipath.datas['path']]
-            pos_to_edit: list = [i for i in range(len(path_segments)-sequence_length+1) if (
+            # Windows are only compared where the first merged node is visited
+            pos_to_edit: list = [i for i, node_name in enumerate(path_segments) if node_name == first_name and (
                 names_to_be_deleted == path_segments[i:i+sequence_length])]
             for pos in pos_to_edit[::-1]:
                 ipath.datas['path'] = ipath.datas['path'][:pos-1] + [(left_most_name, ipath.datas['path'][pos][1])] +\
                     ipath.datas['path'][pos+len(names_to_be_deleted):]
 
         # Delete nodes and edges that are not relevant anymore
+        merged_positions: set[int] = set(segments_positions[1:])
         self.segments = [seg for i, seg in enumerate(
-            self.segments) if i not in segments_positions[1:]]
+            self.segments) if i not in merged_positions]
+        deleted_edges: set[int] = set(edges_to_delete)
+        # Self-loops left by the merge are dropped in the same pass
         self.lines = [lin for i, lin in enumerate(
-            self.lines) if i not in edges_to_delete]
-
-        # Cleaning
-        for sline in self.lines:
-            if sline.datas['start'] == sline.datas['end']:
-                self.lines.remove(sline)
+            self.lines) if i not in deleted_edges and lin.datas['start'] != lin.datas['end']]
+        self.index_records()
 
         return left_most_name
 
@@ -735,37 +911,34 @@ class Graph():
         Returns:
             Segment: the line describing the node
         """
-        node = str(node)
-        for seg in self.segments:
-            if seg.datas["name"] == node:
-                return seg
-        raise ValueError(f"Node {node} is not in graph.")
+        return self.segments[self.get_segment_position(node)]
 
     def remove_duplicates_segments(self) -> None:
         """Search for all nodes that are duplicates of each other, and keeps only one instance per node name"""
         # Cleaning node names
         for seg in self.segments:
-            seg.datas["name"] = sub('\D', '', seg.datas["name"])
+            seg.datas["name"] = strip_non_digits(seg.datas["name"])
         # Purging duplicate values
         self.segments = list(
             {fseg.datas['name']: fseg for fseg in self.segments}.values())
+        self.index_records()
 
     def remove_duplicates_edges(self) -> None:
         """Search for all nodes that are duplicates of each other, and keeps only one instance per node name"""
-        set_of_nodes = [node.datas['name'] for node in self.segments]
+        set_of_nodes: set[str] = {node.datas['name'] for node in self.segments}
         # Purging duplicate values
         self.lines = list(
-            {f"{fedg.datas['start']}_{fedg.datas['end']}": fedg for fedg in self.lines if fedg.datas['end'] != fedg.datas['start'] and fedg.datas['end'] in set_of_nodes and fedg.datas['start'] in set_of_nodes}.values())
+            {(fedg.datas['start'], fedg.datas['end']): fedg for fedg in self.lines if fedg.datas['end'] != fedg.datas['start'] and fedg.datas['end'] in set_of_nodes and fedg.datas['start'] in set_of_nodes}.values())
         # Cleaning edge names
         for edg in self.lines:
-            edg.datas["start"] = sub('\D', '', edg.datas["start"])
-            edg.datas["end"] = sub('\D', '', edg.datas["end"])
+            edg.datas["start"] = strip_non_digits(edg.datas["start"])
+            edg.datas["end"] = strip_non_digits(edg.datas["end"])
 
     def duplicate_segments(self, ntimes: int = 1):
         "Duplicate graph segments"
         duplicates: list = list()
         for _ in range(ntimes):
-            duplicates += deepcopy(self.segments)
+            duplicates += [_clone_segment(seg) for seg in self.segments]
         self.segments += duplicates
 
     def get_segments_by_id(self, node: str | int) -> list[Segment]:
@@ -780,12 +953,12 @@ class Graph():
         node = str(node)
         matching_segments: list = list()
         for seg in self.segments:
-            if sub('\D', '', seg.datas["name"]) == str(node):
+            if strip_non_digits(seg.datas["name"]) == node:
                 matching_segments.append(seg)
         return matching_segments
 
-    def get_segment_position(self, node: str):
-        """Search the node with the corresponding node name inside the graph, and returns it.
+    def get_segment_position(self, node: str) -> int:
+        """Search the node with the corresponding node name inside the graph, and returns its position.
 
         Args:
             node (str): a string, identifier of the node
@@ -794,13 +967,17 @@ class Graph():
             ValueError: if node is not in graph
 
         Returns:
-            Segment: the line describing the node
+            int: the position of the line describing the node in the segments list
         """
         node = str(node)
-        for i, seg in enumerate(self.segments):
-            if seg.datas["name"] == node:
-                return i
-        raise ValueError(f"Node {node} is not in graph.")
+        position: int | None = self._segment_index.get(node)
+        if position is None or position >= len(self.segments) or self.segments[position].datas["name"] != node:
+            # Index may be outdated if the list of segments was edited directly
+            self.index_records()
+            position = self._segment_index.get(node)
+            if position is None:
+                raise ValueError(f"Node {node} is not in graph.")
+        return position
 
     def get_path_list(self) -> list[Path | Walk]:
         """Returns all paths in graphs, described as P or W lines.
@@ -822,11 +999,15 @@ class Graph():
         Returns:
             Path | Walk: the required path
         """
-        for gpath in self.get_path_list():
-            if gpath.datas["name"] == name:
-                return gpath
-        raise ValueError(
-            f"Specified name {name} does not define a path in your GFA file.")
+        gpath: Path | Walk | None = self._path_index.get(name)
+        if gpath is None or gpath.datas["name"] != name:
+            # Index may be outdated if the lists of paths were edited directly
+            self.index_records()
+            gpath = self._path_index.get(name)
+            if gpath is None:
+                raise ValueError(
+                    f"Specified name {name} does not define a path in your GFA file.")
+        return gpath
 
     def assert_format(self) -> GfaStyle:
         """Given the loaded file, asserts the GFA standard it is
@@ -879,8 +1060,16 @@ class Graph():
         Returns:
             list[str]: nodes names matching the condition.
         """
-        bone: DiGraph = self.compute_backbone()
-        return [x for x in bone.nodes() if bone.out_degree(x) == 0 or bone.in_degree(x) == 0]
+        # Degrees are only tested against zero, so knowing which nodes start or end an edge is enough
+        sources: set[str] = {edge.datas['start'] for edge in self.lines}
+        sinks: set[str] = {edge.datas['end'] for edge in self.lines}
+        # Nodes in the order the backbone would list them: segments first, then unknown edge endpoints
+        nodes: dict[str, None] = dict.fromkeys(chain(
+            (node.datas['name'] for node in self.segments),
+            chain.from_iterable((edge.datas['start'], edge.datas['end'])
+                                for edge in self.lines)
+        ))
+        return [x for x in nodes if x not in sources or x not in sinks]
 
     def compute_backbone(self) -> DiGraph:
         """Computes a networkx representation of the graph, for computing purposes
@@ -889,83 +1078,111 @@ class Graph():
             DiGraph: a networkx graph featuring the backbone of the pangenome graph
         """
         backbone: DiGraph = DiGraph()
-
-        for node in self.segments:
-            backbone.add_node(
+        # Nodes and edges are handed over in bulk, as (node, attributes) and (start, end, attributes) tuples
+        backbone.add_nodes_from(
+            (
                 node.datas['name'],
-                offsets=node.datas['PO'] if 'PO' in node.datas else None,
-                sequence=node.datas.get('seq', '')
-            )
-        for edge in self.lines:
-
-            backbone.add_edge(
+                {
+                    'offsets': node.datas.get('PO'),
+                    'sequence': node.datas.get('seq', '')
+                }
+            ) for node in self.segments
+        )
+        backbone.add_edges_from(
+            (
                 edge.datas['start'],
                 edge.datas['end'],
-                label=edge.datas["orientation"],
-            )
+                {
+                    'label': edge.datas["orientation"]
+                }
+            ) for edge in self.lines
+        )
         return backbone
 
     def compute_networkx(self, node_prefix: str | None = None, node_size_classes: tuple[list] = ([0, 1], [2, 10], [11, 50], [51, 200],
-                         [201, 500], [501, 1000], [1001, 10000], [10001, float('inf')])) -> MultiDiGraph:
+                         [201, 500], [501, 1000], [1001, 10000], [10001, float('inf')]), with_colors: bool = True) -> MultiDiGraph:
         """Computes the networkx representation of the GFA.
         This function is intended to be used for graphical representation purposes, and not for computing metrics on the graph.
 
         Args:
             node_prefix (str): a prefix used when displaying multiple graphs to prevent node name collisions
+            with_colors (bool, optional): if palettes should be computed to color nodes and edges. If False, colors are None. Defaults to True.
 
         Returns:
             MultiDiGraph: a networkx graph featuring the maximum of information
         """
-        node_palette: list = get_palette(
-            len(node_size_classes), cmap_name='cool', as_hex=True)
-        self.colors = {f"bp{bound_low}-{bound_high}": node_palette[i]
-                       for i, (bound_low, bound_high) in enumerate(node_size_classes)}
+        if with_colors:
+            node_palette: list = get_palette(
+                len(node_size_classes), cmap_name='cool', as_hex=True)
+            self.colors = {f"bp{bound_low}-{bound_high}": node_palette[i]
+                           for i, (bound_low, bound_high) in enumerate(node_size_classes)}
         node_prefix = f"{node_prefix}_" if node_prefix is not None else ""
+        # Nodes of a same length share their color, so each distinct length is classified once
+        length_colors: dict[int, str] = dict()
+        color: str | None = None
+        add_node: Callable = self.graph.add_node
         for node in self.segments:
-            node_title: list = []
-            for key, val in node.datas.items():
-                if isinstance(val, dict):
-                    node_title.extend([f"{k} : {v}" for k, v in val.items()])
-                else:
-                    node_title.append(f"{key} : {val}")
-            self.graph.add_node(
-                f"{node_prefix}{node.datas['name']}",
-                title='\n'.join(node_title),
-                color=node_palette[[index for index, (low_limit, high_limit) in enumerate(
-                    node_size_classes) if node.datas["length"] >= low_limit and node.datas["length"] <= high_limit][0]],
+            datas: dict = node.datas
+            name: str = datas['name']
+            length: int = datas['length']
+            if with_colors and (color := length_colors.get(length)) is None:
+                color = length_colors[length] = node_palette[[index for index, (low_limit, high_limit) in enumerate(
+                    node_size_classes) if length >= low_limit and length <= high_limit][0]]
+            # Mandatory fields are templated, only the remaining tags are iterated
+            node_title: str = '\n'.join(chain(
+                (f"name : {name}", f"length : {length}"),
+                chain.from_iterable(
+                    (f"{k} : {v}" for k, v in val.items()) if isinstance(
+                        val, dict) else (f"{key} : {val}",)
+                    for key, val in datas.items() if key not in _FIXED_TITLE_KEYS
+                )
+            ))
+            add_node(
+                f"{node_prefix}{name}",
+                title=node_title,
+                color=color,
                 size=10,
-                offsets=node.datas['PO'] if 'PO' in node.datas else None,
-                sequence=node.datas.get('seq', '')
+                offsets=datas.get('PO'),
+                sequence=datas.get('seq', '')
             )
-        palette: list = get_palette(
-            len(path_list := self.get_path_list()), as_hex=True)
-
-        self.colors = {**self.colors, **{p.datas["name"]: palette[i]
-                       for i, p in enumerate(path_list)}}
-        if len(path_list) > 0:
-            visited_paths: int = 0
-            for visited_path in path_list:
-                for i in range(len(visited_path.datas["path"])-1):
-                    left_node, left_orient = visited_path.datas["path"][i]
-                    right_node, right_orient = visited_path.datas["path"][i+1]
-                    self.graph.add_edge(
+        path_list: list[Path | Walk] = self.get_path_list()
+        if path_list:
+            # Path palette is only needed when there are paths to color
+            if with_colors:
+                palette: list = get_palette(len(path_list), as_hex=True)
+                self.colors = {**self.colors, **{p.datas["name"]: palette[i]
+                               for i, p in enumerate(path_list)}}
+            else:
+                palette: list = [None] * len(path_list)
+            for visited_paths, visited_path in enumerate(path_list):
+                steps: list = visited_path.datas["path"]
+                title: str = str(visited_path.datas["name"])
+                color: str = palette[visited_paths]
+                self.graph.add_edges_from(
+                    (
                         f"{node_prefix}{left_node}",
                         f"{node_prefix}{right_node}",
-                        title=str(visited_path.datas["name"]),
-                        color=palette[visited_paths],
-                        label=f"{left_orient.value}/{right_orient.value}",
-                        weight=3
-                    )
-                visited_paths += 1
+                        {
+                            'title': title,
+                            'color': color,
+                            'label': _ORIENTATION_PAIR_LABELS[(left_orient, right_orient)],
+                            'weight': 3
+                        }
+                    ) for (left_node, left_orient), (right_node, right_orient) in zip(steps, steps[1:])
+                )
         else:
-            for edge in self.lines:
-                self.graph.add_edge(
+            edge_color: str | None = 'darkred' if with_colors else None
+            self.graph.add_edges_from(
+                (
                     f"{node_prefix}{edge.datas['start']}",
                     f"{node_prefix}{edge.datas['end']}",
-                    color='darkred',
-                    label=edge.datas["orientation"],
-                    weight=3
-                )
+                    {
+                        'color': edge_color,
+                        'label': edge.datas["orientation"],
+                        'weight': 3
+                    }
+                ) for edge in self.lines
+            )
         return self.graph
 
     def save_graph(self, output_path: str, output_format: GfaStyle | None = None) -> None:
@@ -977,26 +1194,21 @@ class Graph():
                 if None, default graph format will be used.
         """
         output_format = output_format or self.version
-        line_number: int = 0
-        with open(output_path, 'w', encoding='utf-8') as gfa_writer:
+        # Records are written one by one into a large buffer, which is flushed to disk in big blocks
+        with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as gfa_writer:
+            write: Callable = gfa_writer.write
             if self.headers and output_format != GfaStyle.RGFA:
                 for head in self.headers:
-                    gfa_writer.write(
-                        "H\t"+'\t'.join([f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in head.datas.items()])+"\n")
-            if self.segments:
-                for seg in self.segments:
-                    gfa_writer.write("S\t"+f"{seg.datas['name']}\t{seg.datas['seq'] if 'seq' in seg.datas else 'N'*seg.datas['length']}\t" + '\t'.join(
-                        [f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in seg.datas.items() if key not in ['length', 'seq', 'name']])+"\n")
-            if self.lines:
-                for lin in self.lines:
-                    ori1, ori2 = lin.datas['orientation'].split('/')
-                    gfa_writer.write(f"L\t"+f"{lin.datas['start']}\t{ori1}\t{lin.datas['end']}\t{ori2}\t" + '\t'.join(
-                        [f"{key}:{dtype(value)}:{value}" if not key.startswith('ARG') else str(value) for key, value in lin.datas.items() if key not in ['orientation', 'start', 'end']])+"\n")
-            if self.get_path_list():
-                for pathl in self.get_path_list():
-                    gfa_writer.write(
-                        f"{write_path(pathl,output_format,line_number)}")
-                    line_number += 1
+                    write(f"H\t{_format_tags(head.datas)}\n")
+            for seg in self.segments:
+                write(
+                    f"S\t{seg.datas['name']}\t{seg.seq}\t{_format_tags(seg.datas, _SEGMENT_FIELDS)}\n")
+            for lin in self.lines:
+                ori1, ori2 = lin.datas['orientation'].split('/')
+                write(
+                    f"L\t{lin.datas['start']}\t{ori1}\t{lin.datas['end']}\t{ori2}\t{_format_tags(lin.datas, _LINE_FIELDS)}\n")
+            for line_number, pathl in enumerate(self.get_path_list()):
+                write(write_path(pathl, output_format, line_number))
 
 
 def write_path(way: Walk | Path, gfa_format: GfaStyle, line_number: int) -> str:
@@ -1017,8 +1229,8 @@ def write_path(way: Walk | Path, gfa_format: GfaStyle, line_number: int) -> str:
 
     else:
         # W-line
-        offset_start: int | str = way.datas['start_offset'] if 'start_offset' in way.datas else '?'
-        offset_stop: int | str = way.datas['stop_offset'] if 'stop_offset' in way.datas else '?'
+        offset_start: int | str = way.datas.get('start_offset', '?')
+        offset_stop: int | str = way.datas.get('stop_offset', '?')
         strpath: str = ''.join(
             [f"{'>' if orient == Orientation.FORWARD else '<'}{node_name}" for node_name, orient in way.datas['path']])
-        return f"W\t{way.datas['name']}\t{way.datas['origin'] if 'origin' in way.datas else line_number}\t{way.datas['name']}\t{offset_start}\t{offset_stop}\t{strpath}\t*\n"
+        return f"W\t{way.datas['name']}\t{way.datas.get('origin', line_number)}\t{way.datas['name']}\t{offset_start}\t{offset_stop}\t{strpath}\t*\n"
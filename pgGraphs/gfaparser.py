@@ -1,12 +1,86 @@
-from re import match
-from typing import Callable
+from string import ascii_uppercase, ascii_letters
+from typing import Callable, TextIO
 from json import loads, dumps
 from os import path, stat
 from pgGraphs.abstractions import Orientation, GFALine, GFAFormat
-from gzip import open as gz_open
+try:
+    # ISA-L decompresses gzip several times faster than zlib, and is used when installed
+    from isal.igzip import open as gz_open
+except ImportError:
+    from gzip import open as gz_open
 from re import search
 from pathlib import Path
 
+# Allowed characters for the name and the type of an optional tag (XX:T:value)
+_TAG_NAME_CHARS: frozenset = frozenset(ascii_uppercase)
+_TAG_TYPE_CHARS: frozenset = frozenset(ascii_letters)
+# Cast to apply to the value of an optional tag, by GFA type letter
+_GFA_TYPES: dict[str, type | Callable] = {
+    'i': int, 'f': float, 'A': str, 'Z': str, 'J': loads}
+# GFA type letters of the most common tag value types, looked up by exact type
+_PYTHON_TYPES: dict[type, str] = {int: 'i', bool: 'i', float: 'f', str: 'Z'}
+# Orientation members by GFA sign, to avoid an Enum lookup per path step
+_ORIENTATIONS: dict[str, Orientation] = {
+    orientation.value: orientation for orientation in Orientation}
+# GFA type letter and encoder of the most common tag value types, looked up by exact type
+_TAG_ENCODERS: dict[type, tuple[str, Callable]] = {
+    python_type: (tag_type, str) for python_type, tag_type in _PYTHON_TYPES.items()}
+# Fields of each record stored alongside tags, which are not written back as tags
+_SEGMENT_FIELDS: frozenset = frozenset(('length', 'seq'))
+_LINE_FIELDS: frozenset = frozenset(('orientation', 'start', 'end'))
+_PATH_FIELDS: frozenset = frozenset(
+    ('path', 'start_offset', 'stop_offset', 'origin', 'name', 'id'))
+
+
+def _format_tags(datas: dict, skip: frozenset) -> str:
+    """Formats the optional tags of a record as GFA fields, joined by tabulations.
+    Unnamed fields (ARG) are written back as is, other tags as XX:T:value.
+
+    Parameters
+    ----------
+    datas : dict
+        the datas of a record
+    skip : frozenset
+        fields of the record which are not tags
+
+    Returns
+    -------
+    str
+        the tags of the record, ready to be written
+    """
+    encoder_of: Callable = _TAG_ENCODERS.get
+    tags: list[str] = list()
+    for key, value in datas.items():
+        if key in skip:
+            continue
+        if key.startswith('ARG'):
+            tags.append(str(value))
+            continue
+        # Values of uncommon types go through the full type inference
+        if (encoder := encoder_of(type(value))) is None:
+            tag_type: str = GFAParser.get_python_type(value)
+            encoder = (tag_type, GFAParser.set_gfa_type(tag_type))
+        tags.append(f"{key}:{encoder[0]}:{encoder[1](value)}")
+    return '\t'.join(tags)
+
+
+def open_gfa(gfa_file: str) -> TextIO:
+    """Opens a GFA file for reading as text, decompressing it on the fly if it is gzipped (.gfa.gz).
+
+    Parameters
+    ----------
+    gfa_file : str
+        path to a .gfa or .gfa.gz file
+
+    Returns
+    -------
+    TextIO
+        a text stream over the lines of the file
+    """
+    if gfa_file.endswith('.gfa'):
+        return open(gfa_file, 'r', encoding='utf-8')
+    return gz_open(gfa_file, 'rt')
+
 
 def path_allocator(
     path_to_validate: str,
@@ -113,7 +187,7 @@ class GFAParser:
                     "File is empty."
                 )
 
-            with open(gfa_file, 'r', encoding='utf-8') if gfa_file.endswith('.gfa') else gz_open(gfa_file, 'rt') as gfa_reader:
+            with open_gfa(gfa_file) as gfa_reader:
                 header: str = gfa_reader.readline()
                 if header[0] != 'H':
                     styles.append('rGFA')
@@ -161,15 +235,9 @@ class GFAParser:
         ValueError
             Type identifer is not in the GFA-spec
         """
-        if tag_type == 'i':
-            return int
-        elif tag_type == 'f':
-            return float
-        elif tag_type == 'A' or tag_type == 'Z':
-            return str
-        elif tag_type == 'J':
-            return loads
-        elif tag_type == 'H' or tag_type == 'B':
+        if (cast := _GFA_TYPES.get(tag_type)) is not None:
+            return cast
+        if tag_type == 'H' or tag_type == 'B':
             raise NotImplementedError()
         raise ValueError(
             f"Type identifier {tag_type} is not in the GFA standard")
@@ -215,6 +283,8 @@ class GFAParser:
         ValueError
             data type could not be encoded in the GFA-spec
         """
+        if (tag_type := _PYTHON_TYPES.get(type(data))) is not None:
+            return tag_type
         if isinstance(data, int):
             return 'i'
         elif isinstance(data, float):
@@ -249,9 +319,11 @@ class GFAParser:
         nargs: int = length_condition
         if len(datas) > length_condition:  # we happen to have additional tags to our line
             for additional_tag in datas[length_condition:]:
-                if match('[A-Z]{2}:[a-zA-Z]{1}:', additional_tag):  # matches start of the line
-                    mapping[additional_tag[:2]] = GFAParser.get_gfa_type(
-                        additional_tag[3])(additional_tag[5:])
+                # matches start of the line against XX:T:
+                if len(additional_tag) >= 5 and additional_tag[2] == ':' and additional_tag[4] == ':' and additional_tag[0] in _TAG_NAME_CHARS and additional_tag[1] in _TAG_NAME_CHARS and additional_tag[3] in _TAG_TYPE_CHARS:
+                    # Unsupported or unknown types go through get_gfa_type, which raises the right error
+                    mapping[additional_tag[:2]] = (_GFA_TYPES.get(additional_tag[3]) or GFAParser.get_gfa_type(
+                        additional_tag[3]))(additional_tag[5:])
                 else:
                     mapping[f"ARG{nargs}"] = additional_tag
                     nargs += 1
@@ -278,85 +350,56 @@ class GFAParser:
         tuple[str, GFALine, dict]
             Contains `id_of_line`, `type_of_line`, `datas_of_line`
         """
-        line_datas: dict = dict()
         if not (datas[0].isupper() or len(datas) == 0):
             return (None, None, None)
 
-        match (line_type := GFALine(datas[0])):
-            case GFALine.SEGMENT:
-                line_datas["length"] = len(datas[2].strip())
-                if load_sequence_in_memory:
-                    line_datas["seq"] = datas[2].strip()
-                if not memory_mode:
-                    return (datas[1], line_type, {**line_datas, **GFAParser.supplementary_datas(datas, 3)})
-                else:
-                    return (datas[1], line_type, line_datas)
-            case GFALine.LINK:
-                if not memory_mode:
-                    line_datas["orientation"] = set(
-                        [
-                            (
-                                Orientation(datas[2]),
-                                Orientation(datas[4]),
-                            )
-                        ]
-                    )
-                    return ((datas[1], datas[3]), line_type, {**line_datas, **GFAParser.supplementary_datas(datas, 5)})
-                else:
-                    return (None, None, None)
-            case GFALine.WALK:
-                line_datas["name"] = datas[1]
-                line_datas["origin"] = datas[2]
-                line_datas["id"] = datas[3]
-                line_datas["start_offset"] = datas[4]
-                line_datas["stop_offset"] = datas[5]
-                try:
-                    line_datas["path"] = [
-                        (
-                            node[1:],
-                            Orientation(node[0])
-                        )
-                        for node in datas[6].replace('>', ',+').replace('<', ',-')[1:].split(',')
-                    ]
-                except IndexError:
-                    line_datas["path"] = list()
-                try:
-                    # search(regexp_pattern, datas[3]).group(1).upper()
-                    label: str = search(
-                        regexp_pattern, f'{datas[1]}#{datas[2]}#{datas[3]}'
-                    ).group(1)
-                except:
-                    label: str = datas[3].upper()
-                return (label, line_type, {**line_datas, **GFAParser.supplementary_datas(datas, 7)})
-            case GFALine.PATH:
-                if len(datas[1].split('#')) == 3:
-                    line_datas["name"] = datas[1].split('#')[0]
-                    line_datas["origin"] = datas[1].split('#')[1]
-                    line_datas["id"] = datas[1].split('#')[2]
-                else:
-                    line_datas["name"] = datas[1]
-                    line_datas["origin"] = None
-                    line_datas["id"] = datas[1]
-                line_datas["start_offset"] = None
-                line_datas["stop_offset"] = None
-                try:
-                    line_datas["path"] = [
-                        (
-                            node[:-1],
-                            Orientation(node[-1])
-                        )
-                        for node in datas[2].split(',')
-                    ]
-                except IndexError:
-                    line_datas["path"] = list()
-                try:
-                    label: str = search(
-                        regexp_pattern, line_datas["id"]).group(1)
-                except:
-                    label: str = line_datas["id"].upper()
-                return (label, line_type, {**line_datas, **GFAParser.supplementary_datas(datas, 7)})
-            case GFALine.HEADER | GFALine.ANY:
-                return (None, line_type, GFAParser.supplementary_datas(datas, 1))
+        # Each line type has its own reader, other letters are not supported
+        try:
+            reader: Callable = _LINE_READERS[datas[0]]
+        except KeyError:
+            raise ValueError(
+                f"{datas[0]!r} is not a valid GFALine") from None
+        return reader(datas, load_sequence_in_memory, regexp_pattern, memory_mode)
+
+    @staticmethod
+    def read_segment_without_sequence(gfa_line: str, memory_mode: bool = False) -> tuple[str, GFALine, dict]:
+        """Parses a raw S-line without ever building its sequence string, when sequences are not loaded.
+        The length of the sequence is computed from the positions of the tabulations around it.
+
+        Parameters
+        ----------
+        gfa_line : str
+            a raw GFA segment line, as read from the file
+        memory_mode : bool, optional
+            if additional information should be loaded in the struct, by default False
+
+        Returns
+        -------
+        tuple[str, GFALine, dict]
+            Contains `id_of_line`, `type_of_line`, `datas_of_line`, as GFAParser.read_gfa_line would
+
+        Raises
+        ------
+        IndexError
+            the line does not have a sequence field
+        """
+        name_start: int = gfa_line.find('\t') + 1
+        seq_start: int = gfa_line.find('\t', name_start) + 1
+        if not name_start or not seq_start:
+            raise IndexError("Segment line does not have a sequence field.")
+        seq_end: int = gfa_line.find('\t', seq_start)
+        if seq_end == -1:
+            # Sequence is the last field, only followed by the line ending
+            seq_end = len(gfa_line) - \
+                (2 if gfa_line.endswith('\r\n') else gfa_line.endswith('\n'))
+            return (gfa_line[name_start:seq_start-1], GFALine.SEGMENT, {"length": seq_end - seq_start})
+        line_datas: dict = {"length": seq_end - seq_start}
+        if not memory_mode:
+            # Sequence is cut out of the line, so tags are split at their usual positions
+            datas: list[str] = (
+                gfa_line[:seq_start] + gfa_line[seq_end:]).rstrip('\r\n').split('\t')
+            line_datas.update(GFAParser.supplementary_datas(datas, 3))
+        return (gfa_line[name_start:seq_start-1], GFALine.SEGMENT, line_datas)
 
     @staticmethod
     def save_graph(graph, output_path: str, force_format: GFAFormat | bool = False, minimal_graph: bool = False) -> None:
@@ -379,13 +422,14 @@ class GFAParser:
         gfa_format: GFAFormat = graph.metadata['version'] if not force_format else force_format
 
         with open(path_allocator(output_path), 'w', encoding='utf-8') as gfa_writer:
+            write: Callable = gfa_writer.write
             if graph.headers and gfa_format != GFAFormat.RGFA:
                 # Writing hearder to output file if file is not rgfa
                 for header in graph.headers:
                     supplementary_text: str = '' if minimal_graph else '\t' + \
                         '\t'.join(
                             [str(value) for key, value in header.items() if key.startswith('ARG')])
-                    gfa_writer.write(
+                    write(
                         "H\t"
                         +
                         '\t'.join(
@@ -401,35 +445,32 @@ class GFAParser:
             if graph.segments:
                 # Whichever the format, those should be written
                 for segment_name, segment_datas in graph.segments.items():
-                    supplementary_text: str = '' if minimal_graph else "\t" + '\t'.join(
-                        [f"{key}:{GFAParser.get_python_type(value)}:{GFAParser.set_gfa_type(GFAParser.get_python_type(value))(value)}" if not key.startswith('ARG') else str(value) for key, value in segment_datas.items() if key not in ['length', 'seq']])
-                    gfa_writer.write(
-                        "S\t"+f"{segment_name}\t{segment_datas['seq'] if 'seq' in segment_datas else 'N'*segment_datas['length']}{supplementary_text}\n")
+                    supplementary_text: str = '' if minimal_graph else "\t" + _format_tags(segment_datas, _SEGMENT_FIELDS)
+                    write(
+                        f"S\t{segment_name}\t{segment_datas.get('seq') or 'N'*segment_datas['length']}{supplementary_text}\n")
             if graph.lines:
                 for (source, sink), line in graph.lines.items():
-                    supplementary_text: str = '' if minimal_graph else "\t" + '\t'.join(
-                        [f"{key}:{GFAParser.get_python_type(value)}:{GFAParser.set_gfa_type(GFAParser.get_python_type(value))(value)}" if not key.startswith('ARG') else str(value) for key, value in line.items() if key not in ['orientation', 'start', 'end']])
+                    supplementary_text: str = '' if minimal_graph else "\t" + _format_tags(line, _LINE_FIELDS)
                     # We accomodate for all alternatives orientation versions that are described in the input graph file to be written back
                     for alt in line['orientation']:
                         ori1, ori2 = alt
-                        gfa_writer.write(
-                            f"L\t"+f"{source}\t{ori1.value}\t{sink}\t{ori2.value}\t0M{supplementary_text}\n")
+                        write(
+                            f"L\t{source}\t{ori1.value}\t{sink}\t{ori2.value}\t0M{supplementary_text}\n")
             if graph.paths:
                 for path_name, path_datas in graph.paths.items():
-                    supplementary_text: str = '' if minimal_graph else "\t" + '\t'.join(
-                        [f"{key}:{GFAParser.get_python_type(value)}:{GFAParser.set_gfa_type(GFAParser.get_python_type(value))(value)}" if not key.startswith('ARG') else str(value) for key, value in path_datas.items() if key not in ['path', 'start_offset', 'stop_offset', 'origin', 'name', 'id']])
+                    supplementary_text: str = '' if minimal_graph else "\t" + _format_tags(path_datas, _PATH_FIELDS)
                     if gfa_format == GFAFormat.RGFA:
                         pass
                     elif gfa_format == GFAFormat.GFA1_1 or gfa_format == GFAFormat.GFA1_2 or gfa_format == GFAFormat.GFA2:
                         # W-line
-                        offset_start: int | str = path_datas[
-                            'start_offset'] if 'start_offset' in path_datas and path_datas['start_offset'] else 0
-                        offset_stop: int | str = path_datas['stop_offset'] if 'stop_offset' in path_datas and path_datas['stop_offset'] else sum(
+                        offset_start: int | str = path_datas.get(
+                            'start_offset') or 0
+                        offset_stop: int | str = path_datas.get('stop_offset') or sum(
                             [graph.segments[x]['length'] for (x, _) in path_datas['path']])
                         strpath: str = ''.join(
                             [f"{'>' if orient == Orientation.FORWARD or orient == '+' else '<'}{node_name}" for node_name, orient in path_datas['path']])
-                        gfa_writer.write(
-                            f"W\t{path_name}\t{path_datas['origin'] if 'origin' in path_datas and path_datas['origin'] else haplotype_number}\t{path_name}\t{offset_start}\t{offset_stop}\t{strpath}{supplementary_text}\n")
+                        write(
+                            f"W\t{path_name}\t{path_datas.get('origin') or haplotype_number}\t{path_name}\t{offset_start}\t{offset_stop}\t{strpath}{supplementary_text}\n")
                     # In the case graph format is rgfa, we don't write any paths to output file
                     else:  # P-line
                         # We recompose the name of the path if needed
@@ -439,7 +480,7 @@ class GFAParser:
                             label: str = f"{path_datas['name']}#{path_datas['origin']}#{path_datas['id']}"
                         strpath: str = ','.join(
                             [node_name+'+' if orient == Orientation.FORWARD else node_name+'-' for node_name, orient in path_datas['path']])
-                        gfa_writer.write(
+                        write(
                             f"P\t{path_name}\t{strpath}{supplementary_text}\n")
                     haplotype_number += 1
 
@@ -468,13 +509,14 @@ class GFAParser:
             gfa_format: GFAFormat = force_format
 
         with open(path_allocator(output_path), 'w', encoding='utf-8') as gfa_writer:
+            write: Callable = gfa_writer.write
             if graph.headers and gfa_format != GFAFormat.RGFA:
                 # Writing hearder to output file if file is not rgfa
                 for header in graph.headers:
                     supplementary_text: str = '' if minimal_graph else '\t' + \
                         '\t'.join(
                             [str(value) for key, value in header.items() if key.startswith('ARG')])
-                    gfa_writer.write(
+                    write(
                         "H\t"
                         +
                         '\t'.join(
@@ -491,38 +533,139 @@ class GFAParser:
                 # Whichever the format, those should be written
                 for segment_name, segment_datas in graph.segments.items():
                     if segment_name in nodes:
-                        supplementary_text: str = '' if minimal_graph else "\t" + '\t'.join(
-                            [f"{key}:{GFAParser.get_python_type(value)}:{GFAParser.set_gfa_type(GFAParser.get_python_type(value))(value)}" if not key.startswith('ARG') else str(value) for key, value in segment_datas.items() if key not in ['length', 'seq']])
-                        gfa_writer.write(
-                            "S\t"+f"{segment_name}\t{segment_datas['seq'] if 'seq' in segment_datas else 'N'*segment_datas['length']}{supplementary_text}\n")
+                        supplementary_text: str = '' if minimal_graph else "\t" + _format_tags(segment_datas, _SEGMENT_FIELDS)
+                        write(
+                            f"S\t{segment_name}\t{segment_datas.get('seq') or 'N'*segment_datas['length']}{supplementary_text}\n")
             if graph.lines:
                 for (source, sink), line in graph.lines.items():
                     if source in nodes and sink in nodes:
-                        supplementary_text: str = '' if minimal_graph else "\t" + '\t'.join(
-                            [f"{key}:{GFAParser.get_python_type(value)}:{GFAParser.set_gfa_type(GFAParser.get_python_type(value))(value)}" if not key.startswith('ARG') else str(value) for key, value in line.items() if key not in ['orientation', 'start', 'end']])
+                        supplementary_text: str = '' if minimal_graph else "\t" + _format_tags(line, _LINE_FIELDS)
                         # We accomodate for all alternatives orientation versions that are described in the input graph file to be written back
                         for alt in line['orientation']:
                             ori1, ori2 = alt
-                            gfa_writer.write(
-                                f"L\t"+f"{source}\t{ori1.value}\t{sink}\t{ori2.value}\t0M{supplementary_text}\n")
+                            write(
+                                f"L\t{source}\t{ori1.value}\t{sink}\t{ori2.value}\t0M{supplementary_text}\n")
             if graph.paths:
                 for path_name, path_datas in graph.paths.items():
-                    supplementary_text: str = '' if minimal_graph else "\t" + '\t'.join(
-                        [f"{key}:{GFAParser.get_python_type(value)}:{GFAParser.set_gfa_type(GFAParser.get_python_type(value))(value)}" if not key.startswith('ARG') else str(value) for key, value in path_datas.items() if key not in ['path', 'start_offset', 'stop_offset', 'origin', 'name', 'id']])
+                    supplementary_text: str = '' if minimal_graph else "\t" + _format_tags(path_datas, _PATH_FIELDS)
                     if gfa_format == GFAFormat.GFA1 or gfa_format == GFAFormat.ANY:  # P-line
                         strpath: str = ','.join(
                             [node_name+'+' if orient == Orientation.FORWARD else node_name+'-' for node_name, orient in path_datas['path'] if node_name in nodes])
-                        gfa_writer.write(
+                        write(
                             f"P\t{path_name}\t{strpath}{supplementary_text}\n")
                     elif gfa_format == GFAFormat.GFA1_1 or gfa_format == GFAFormat.GFA1_2 or gfa_format == GFAFormat.GFA2:
                         # W-line
-                        offset_start: int | str = path_datas[
-                            'start_offset'] if 'start_offset' in path_datas and path_datas['start_offset'] else 0
-                        offset_stop: int | str = path_datas['stop_offset'] if 'stop_offset' in path_datas and path_datas['stop_offset'] else sum(
+                        offset_start: int | str = path_datas.get(
+                            'start_offset') or 0
+                        offset_stop: int | str = path_datas.get('stop_offset') or sum(
                             [graph.segments[x]['length'] for (x, _) in path_datas['path']])
                         strpath: str = ''.join(
                             [f"{'>' if orient == Orientation.FORWARD or orient == '+' else '<'}{node_name}" for node_name, orient in path_datas['path'] if node_name in nodes])
-                        gfa_writer.write(
-                            f"W\t{path_name}\t{path_datas['origin'] if 'origin' in path_datas and path_datas['origin'] else haplotype_number}\t{path_name}\t{offset_start}\t{offset_stop}\t{strpath}{supplementary_text}\n")
+                        write(
+                            f"W\t{path_name}\t{path_datas.get('origin') or haplotype_number}\t{path_name}\t{offset_start}\t{offset_stop}\t{strpath}{supplementary_text}\n")
                     # In the case graph format is rgfa, we don't write any paths to output file
                     haplotype_number += 1
+
+
+def _read_segment(datas: list[str], load_sequence_in_memory: bool, regexp_pattern: str, memory_mode: bool) -> tuple[str, GFALine, dict]:
+    "Reads a S-line, see GFAParser.read_gfa_line"
+    sequence: str = datas[2].strip()
+    line_datas: dict = {"length": len(sequence)}
+    if load_sequence_in_memory:
+        line_datas["seq"] = sequence
+    if not memory_mode:
+        return (datas[1], GFALine.SEGMENT, {**line_datas, **GFAParser.supplementary_datas(datas, 3)})
+    else:
+        return (datas[1], GFALine.SEGMENT, line_datas)
+
+
+def _read_link(datas: list[str], load_sequence_in_memory: bool, regexp_pattern: str, memory_mode: bool) -> tuple[tuple[str, str], GFALine, dict]:
+    "Reads a L-line, see GFAParser.read_gfa_line"
+    if not memory_mode:
+        line_datas: dict = {
+            "orientation": set(
+                [
+                    (
+                        _ORIENTATIONS[datas[2]],
+                        _ORIENTATIONS[datas[4]],
+                    )
+                ]
+            )
+        }
+        return ((datas[1], datas[3]), GFALine.LINK, {**line_datas, **GFAParser.supplementary_datas(datas, 5)})
+    else:
+        return (None, None, None)
+
+
+def _read_walk(datas: list[str], load_sequence_in_memory: bool, regexp_pattern: str, memory_mode: bool) -> tuple[str, GFALine, dict]:
+    "Reads a W-line, see GFAParser.read_gfa_line"
+    line_datas: dict = dict()
+    line_datas["name"] = datas[1]
+    line_datas["origin"] = datas[2]
+    line_datas["id"] = datas[3]
+    line_datas["start_offset"] = datas[4]
+    line_datas["stop_offset"] = datas[5]
+    try:
+        line_datas["path"] = [
+            (
+                node[1:],
+                _ORIENTATIONS[node[0]]
+            )
+            for node in datas[6].replace('>', ',+').replace('<', ',-')[1:].split(',')
+        ]
+    except IndexError:
+        line_datas["path"] = list()
+    try:
+        # search(regexp_pattern, datas[3]).group(1).upper()
+        label: str = search(
+            regexp_pattern, f'{datas[1]}#{datas[2]}#{datas[3]}'
+        ).group(1)
+    except:
+        label: str = datas[3].upper()
+    return (label, GFALine.WALK, {**line_datas, **GFAParser.supplementary_datas(datas, 7)})
+
+
+def _read_path(datas: list[str], load_sequence_in_memory: bool, regexp_pattern: str, memory_mode: bool) -> tuple[str, GFALine, dict]:
+    "Reads a P-line, see GFAParser.read_gfa_line"
+    line_datas: dict = dict()
+    if len(datas[1].split('#')) == 3:
+        line_datas["name"] = datas[1].split('#')[0]
+        line_datas["origin"] = datas[1].split('#')[1]
+        line_datas["id"] = datas[1].split('#')[2]
+    else:
+        line_datas["name"] = datas[1]
+        line_datas["origin"] = None
+        line_datas["id"] = datas[1]
+    line_datas["start_offset"] = None
+    line_datas["stop_offset"] = None
+    try:
+        line_datas["path"] = [
+            (
+                node[:-1],
+                _ORIENTATIONS[node[-1]]
+            )
+            for node in datas[2].split(',')
+        ]
+    except IndexError:
+        line_datas["path"] = list()
+    try:
+        label: str = search(
+            regexp_pattern, line_datas["id"]).group(1)
+    except:
+        label: str = line_datas["id"].upper()
+    return (label, GFALine.PATH, {**line_datas, **GFAParser.supplementary_datas(datas, 7)})
+
+
+def _read_header(datas: list[str], load_sequence_in_memory: bool, regexp_pattern: str, memory_mode: bool) -> tuple[None, GFALine, dict]:
+    "Reads a H-line, see GFAParser.read_gfa_line"
+    return (None, GFALine.HEADER, GFAParser.supplementary_datas(datas, 1))
+
+
+# Readers of each supported line type, by the letter starting the line
+_LINE_READERS: dict[str, Callable] = {
+    GFALine.SEGMENT.value: _read_segment,
+    GFALine.LINK.value: _read_link,
+    GFALine.WALK.value: _read_walk,
+    GFALine.PATH.value: _read_path,
+    GFALine.HEADER.value: _read_header,
+}
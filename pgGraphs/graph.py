@@ -1,14 +1,16 @@
 "Modelizes a graph object"
 from itertools import count
 from pgGraphs.abstractions import GFALine, Orientation, reverse
-from pgGraphs.gfaparser import GFAParser
-from gzip import open as gz_open
+from pgGraphs.gfaparser import GFAParser, open_gfa, _ORIENTATIONS
 from typing import Any, Generator
 from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import cpu_count
 from typing import Callable
 from collections.abc import Iterable
 
+# Above this length, S-lines are parsed without splitting their sequence out when it is not loaded
+_LONG_SEGMENT_LINE: int = 1024
+
 
 def futures_collector(
     func: Callable,
@@ -118,15 +120,25 @@ class Graph():
 
         # Parsing the gfa file
         if gfa_file and (gfa_file.endswith('.gfa') or gfa_file.endswith('.gfa.gz')):
-            with open(gfa_file, 'r', encoding='utf-8') if gfa_file.endswith('.gfa') else gz_open(gfa_file, 'rt') as gfa_reader:
+            load_sequence: bool = with_sequence and not low_memory
+            with open_gfa(gfa_file) as gfa_reader:
                 for gfa_line in gfa_reader:
-
-                    name, line_type, datas = GFAParser.read_gfa_line(
-                        datas=[__.strip() for __ in gfa_line.split('\t')],
-                        load_sequence_in_memory=with_sequence and not low_memory,
-                        regexp_pattern=regexp,
-                        memory_mode=low_memory,
-                    )
+                    # Blank lines and comments hold no record, and are skipped before any parsing
+                    if gfa_line[0] == '#' or gfa_line.isspace():
+                        continue
+                    if not load_sequence and gfa_line[0] == 'S' and len(gfa_line) > _LONG_SEGMENT_LINE:
+                        # Sequence is not needed, we skip copying it out of the line
+                        name, line_type, datas = GFAParser.read_segment_without_sequence(
+                            gfa_line,
+                            memory_mode=low_memory,
+                        )
+                    else:
+                        name, line_type, datas = GFAParser.read_gfa_line(
+                            datas=gfa_line.rstrip('\r\n').split('\t'),
+                            load_sequence_in_memory=load_sequence,
+                            regexp_pattern=regexp,
+                            memory_mode=low_memory,
+                        )
                     match line_type:
                         case GFALine.SEGMENT:
                             self.segments[name] = datas
@@ -359,24 +371,22 @@ class Graph():
         ValueError
             specified orientation is not compatible with GFA format
         """
-        if not ori_sink in ['+', '-', '?', '=']:
-            try:
-                ori_sink = ori_sink.value
-            except:
-                raise ValueError("Not compatible with GFA format.")
-        if not ori_source in ['+', '-', '?', '=']:
-            try:
-                ori_source = ori_source.value
-            except:
-                raise ValueError("Not compatible with GFA format.")
+        # Orientations are given either as GFA signs or as members, which are looked up by their sign
+        try:
+            orientations: tuple[Orientation, Orientation] = (
+                _ORIENTATIONS[getattr(ori_source, 'value', ori_source)],
+                _ORIENTATIONS[getattr(ori_sink, 'value', ori_sink)]
+            )
+        except (KeyError, TypeError) as exc:
+            raise ValueError("Not compatible with GFA format.") from exc
         if (source, sink) not in self.lines:
             self.lines[(source, sink)] = {
-                'orientation': set([(Orientation(ori_source), Orientation(ori_sink))]),
+                'orientation': set([orientations]),
                 **metadata
             }
         else:
             self.lines[(source, sink)]['orientation'] = self.lines[(source, sink)].get(
-                'orientation', set()) | set([(Orientation(ori_source), Orientation(ori_sink))])
+                'orientation', set()) | set([orientations])
 
     def add_path(
         self,
@@ -558,8 +568,8 @@ class Graph():
             new_path: list[tuple] = list()
             for i, (node_name, orientation) in path_datas['path']:
                 if node_name == segment_name:
-                    new_path.extend([(new_name, Orientation(
-                        orient)) for new_name in future_segment_name])
+                    new_path.extend([(new_name, _ORIENTATIONS[orient])
+                                     for new_name in future_segment_name])
                 else:
                     new_path.append((node_name, orientation))
 
@@ -1,3 +1,5 @@
+from itertools import chain
+from typing import Callable
 from networkx import MultiDiGraph, DiGraph
 from pgGraphs.graph import Graph
 import matplotlib as mpl
@@ -56,20 +58,26 @@ class GFANetwork:
             a networkx object, in the form of a directed graph.
         """
         backbone: DiGraph = DiGraph()
-
-        for node_name, node_datas in graph.segments.items():
-            backbone.add_node(
+        # Nodes and edges are handed over in bulk, as (node, attributes) and (start, end, attributes) tuples
+        backbone.add_nodes_from(
+            (
                 node_name,
-                offsets=node_datas['PO'] if 'PO' in node_datas else None,
-                sequence=node_datas.get('seq', '')
-            )
-        for (start, end), edge_data in graph.lines.items():
-            backbone.add_edge(
+                {
+                    'offsets': node_datas['PO'] if 'PO' in node_datas else None,
+                    'sequence': node_datas.get('seq', '')
+                }
+            ) for node_name, node_datas in graph.segments.items()
+        )
+        backbone.add_edges_from(
+            (
                 start,
                 end,
-                label=' | '.join(
-                    [f'{x.value}/{y.value}' for (x, y) in edge_data["orientation"]]),
-            )
+                {
+                    'label': ' | '.join(
+                        [f'{x.value}/{y.value}' for (x, y) in edge_data["orientation"]])
+                }
+            ) for (start, end), edge_data in graph.lines.items()
+        )
         return backbone
 
     @staticmethod
@@ -82,6 +90,7 @@ class GFANetwork:
                 501, 1000], [1001, 10000], [10001, float('inf')]
         ),
         start_stop_ref: tuple | bool = False,
+        with_colors: bool = True,
     ) -> MultiDiGraph:
         """Computes the networkx representation of the GFA.
         This function is intended to be used for graphical representation purposes, and not for computing metrics on the graph.
@@ -96,6 +105,8 @@ class GFANetwork:
             classes of size for coloring nodes, by default ( [0, 1], [2, 10], [11, 50], [51, 200], [201, 500], [ 501, 1000], [1001, 10000], [10001, float('inf')] )
         start_stop_ref : tuple | bool, optional
             defines starting and ending offset on the reference, by default False
+        with_colors : bool, optional
+            if palettes should be computed to color nodes and edges, colors being None otherwise, by default True
 
         Returns
         -------
@@ -107,68 +118,86 @@ class GFANetwork:
             start, stop, ref = start_stop_ref
         # Define empty graph
         nx_graph: MultiDiGraph = MultiDiGraph()
-        # Creating the palette for node class colors
-        node_palette: list = get_palette(
-            len(node_size_classes),
-            cmap_name='cool',
-            as_hex=True
-        )
-        graph.metadata['colors'] = {
-            f"bp{bound_low}-{bound_high}": node_palette[i] for i, (bound_low, bound_high) in enumerate(node_size_classes)
-        }
+        if with_colors:
+            # Creating the palette for node class colors
+            node_palette: list = get_palette(
+                len(node_size_classes),
+                cmap_name='cool',
+                as_hex=True
+            )
+            graph.metadata['colors'] = {
+                f"bp{bound_low}-{bound_high}": node_palette[i] for i, (bound_low, bound_high) in enumerate(node_size_classes)
+            }
         node_prefix = f"{node_prefix}_" if node_prefix is not None else ""
+        # Nodes of a same length share their color, so each distinct length is classified once
+        length_colors: dict[int, str] = dict()
+        color: str | None = None
+        add_node: Callable = nx_graph.add_node
         # Iterating on nodes
         for node_name, node_datas in graph.segments.items():
-            node_title: list = []
-            for key, val in node_datas.items():
-                if isinstance(val, dict):
-                    node_title.extend([f"{k} : {v}" for k, v in val.items()])
-                else:
-                    node_title.append(f"{key} : {val}")
-            nx_graph.add_node(
+            length: int = node_datas["length"]
+            if with_colors and (color := length_colors.get(length)) is None:
+                color = length_colors[length] = node_palette[[index for index, (low_limit, high_limit) in enumerate(
+                    node_size_classes) if length >= low_limit and length <= high_limit][0]]
+            # Title is joined in one go, dict-valued tags being flattened in place
+            node_title: str = '\n'.join(chain.from_iterable(
+                (f"{k} : {v}" for k, v in val.items()) if isinstance(
+                    val, dict) else (f"{key} : {val}",)
+                for key, val in node_datas.items()
+            ))
+            add_node(
                 f"{node_prefix}{node_name}",
-                title='\n'.join(node_title),
-                color=node_palette[[index for index, (low_limit, high_limit) in enumerate(
-                    node_size_classes) if node_datas["length"] >= low_limit and node_datas["length"] <= high_limit][0]],
+                title=node_title,
+                color=color,
                 size=10,
-                offsets=node_datas['PO'] if 'PO' in node_datas else None,
+                offsets=node_datas.get('PO'),
                 sequence=node_datas.get('seq', '')
             )
-        # Define a palette for paths
-        palette: list = get_palette(
-            len(graph.paths),
-            as_hex=True
-        )
-        # Updating metadata
-        graph.metadata['colors'] = {
-            **graph.metadata['colors'],
-            **{path_name: palette[i] for i, path_name in enumerate(graph.paths.keys())}
-        }
+        if with_colors:
+            # Define a palette for paths
+            palette: list = get_palette(
+                len(graph.paths),
+                as_hex=True
+            )
+            # Updating metadata
+            graph.metadata['colors'] = {
+                **graph.metadata['colors'],
+                **{path_name: palette[i] for i, path_name in enumerate(graph.paths.keys())}
+            }
+        else:
+            palette: list = [None] * len(graph.paths)
         # If paths are available, we iterate on them
         if len(graph.paths) > 0 and enforce_format != GFAFormat.RGFA:
             for y, (path_name, path_datas) in enumerate(graph.paths.items()):
-                for i in range(len(path_datas["path"])-1):
-                    left_node, left_orient = path_datas["path"][i]
-                    right_node, right_orient = path_datas["path"][i+1]
-                    nx_graph.add_edge(
+                steps: list = path_datas["path"]
+                # Edges of a path are added in bulk, pairing each step with the next one
+                nx_graph.add_edges_from(
+                    (
                         f"{node_prefix}{left_node}",
                         f"{node_prefix}{right_node}",
-                        title=path_name,
-                        color=palette[y],
-                        label=f"{left_orient.value}/{right_orient.value}",
-                        weight=3
-                    )
+                        {
+                            'title': path_name,
+                            'color': palette[y],
+                            'label': f"{left_orient.value}/{right_orient.value}",
+                            'weight': 3
+                        }
+                    ) for (left_node, left_orient), (right_node, right_orient) in zip(steps, steps[1:])
+                )
         # Otherwise we use edges
         else:
-            for (start, end), edge_data in graph.lines.items():
-                nx_graph.add_edge(
+            edge_color: str | None = 'darkred' if with_colors else None
+            nx_graph.add_edges_from(
+                (
                     f"{node_prefix}{start}",
                     f"{node_prefix}{end}",
-                    color='darkred',
-                    label=' | '.join(
-                        [f'{x.value}/{y.value}' for (x, y) in edge_data["orientation"]]),
-                    weight=3
-                )
+                    {
+                        'color': edge_color,
+                        'label': ' | '.join(
+                            [f'{x.value}/{y.value}' for (x, y) in edge_data["orientation"]]),
+                        'weight': 3
+                    }
+                ) for (start, end), edge_data in graph.lines.items()
+            )
         return nx_graph
 
     def get_most_external_nodes(self) -> list[str]: